@@ -2,11 +2,23 @@
 Python wrapper for getting air quality data from Airly sensors.
 """
 import logging
-
-import aiohttp
+from typing import TYPE_CHECKING
 
 from airly.installations import _InstallationsLoader
 from airly.measurements import MeasurementsSession
+from airly.parsing import (parse_installation, parse_installations,
+                           parse_measurements)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = [
+    'Airly',
+    'MeasurementsSession',
+    'parse_installation',
+    'parse_installations',
+    'parse_measurements',
+]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,7 +27,7 @@ class Airly:
     """Main class to perform Airly APi requests"""
     AIRLY_API_URL = "https://airapi.airly.eu/v2/"
 
-    def __init__(self, api_key, session: aiohttp.ClientSession,
+    def __init__(self, api_key, session: 'aiohttp.ClientSession',
                  base_url=AIRLY_API_URL, language=None):
         from airly._private import _RequestsHandler
         self._rh = _RequestsHandler(api_key, session, base_url, language)
@@ -30,21 +42,27 @@ class Airly:
             latitude, longitude,
             max_distance_km=max_distance_km, max_results=max_results)
 
-    def create_measurements_session_installation(self, installation_id):
+    @property
+    def transfer_stats(self):
+        """Number of requests, bytes received and bytes after decoding"""
+        return self._rh.stats
+
+    def create_measurements_session_installation(self, installation_id,
+                                                 parts=None):
         return MeasurementsSession(
             self._rh, MeasurementsSession.Mode.INSTALLATION,
-            installation_id=installation_id)
+            installation_id=installation_id, parts=parts)
 
     def create_measurements_session_nearest(
-            self, latitude, longitude, max_distance_km=None):
+            self, latitude, longitude, max_distance_km=None, parts=None):
         return MeasurementsSession(
             self._rh,
             MeasurementsSession.Mode.NEAREST,
             latitude=latitude, longitude=longitude,
-            max_distance_km=max_distance_km)
+            max_distance_km=max_distance_km, parts=parts)
 
     def create_measurements_session_point(
-            self, latitude, longitude):
+            self, latitude, longitude, parts=None):
         return MeasurementsSession(
             self._rh, MeasurementsSession.Mode.POINT,
-            latitude=latitude, longitude=longitude)
+            latitude=latitude, longitude=longitude, parts=parts)
@@ -1,34 +1,78 @@
+import importlib
 import json
-
-import aiohttp
 import logging
+from typing import TYPE_CHECKING
 
 from airly.exceptions import AirlyError
 
+if TYPE_CHECKING:
+    import aiohttp
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _load_json(raw):
+    """Decode JSON given as bytes or str. Already decoded data is returned
+    unchanged."""
+    if isinstance(raw, (bytes, bytearray, str)):
+        return json.loads(raw)
+    return raw
+
+
 class _EmptyFormat:
     def __format__(self, format_spec):
         return ''
 
 
+def _has_decoder(flag):
+    """Check aiohttp flag like HAS_BROTLI. Older aiohttp versions keep
+    them in http_parser instead of compression_utils."""
+    for module_name in ('aiohttp.compression_utils', 'aiohttp.http_parser'):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if hasattr(module, flag):
+            return bool(getattr(module, flag))
+    return False
+
+
+def _accept_encoding():
+    """Content encodings the installed aiohttp is able to decode,
+    best compression first."""
+    encodings = ['gzip', 'deflate']
+    if _has_decoder('HAS_BROTLI'):
+        encodings.insert(0, 'br')
+    if _has_decoder('HAS_ZSTD'):
+        encodings.insert(0, 'zstd')
+    return ', '.join(encodings)
+
+
 class _RequestsHandler:
     """Internal class to create Airly requests"""
 
-    def __init__(self, api_key, session: aiohttp.ClientSession, base_url,
+    def __init__(self, api_key, session: 'aiohttp.ClientSession', base_url,
                  language=None):
         self.headers = {
             'Accept': 'application/json',
-            'Accept-Encoding': 'gzip',
+            'Accept-Encoding': _accept_encoding(),
             'apikey': api_key,
         }
         if language is not None:
             self.headers['Accept-Language'] = language
         self.base_url = base_url
         self.session = session
+        # Totals for all requests sent by this handler. Responses whose size
+        # on the wire is unknown are counted in unknown_bytes_in only.
+        self.stats = _DictToObj(requests=0, bytes_in=0, unknown_bytes_in=0,
+                                decoded_size=0)
+
+    async def get(self, request_path, on_response=None):
+        """Send request and return decoded JSON data.
 
-    async def get(self, request_path):
+        If given, on_response is called with stats of this very response:
+        url, content_encoding, bytes_in and decoded_size.
+        """
         url = self.base_url + request_path
         _LOGGER.debug("Sending request: " + url)
         async with self.session.get(url, headers=self.headers) as response:
@@ -37,9 +81,35 @@ class _RequestsHandler:
                                 response.status)
                 raise AirlyError(response.status, await response.text())
 
-            data = await response.json()
-            _LOGGER.debug(json.dumps(data))
-            return data
+            body = await response.read()
+            response_stats = self._account(url, response, body)
+            if on_response is not None:
+                on_response(response_stats)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(body.decode())
+            return json.loads(body)
+
+    def _account(self, url, response, body):
+        # Size on the wire, i.e. before decompression. Older aiohttp does not
+        # count raw bytes, so fall back to Content-Length header then. If
+        # that is missing too (chunked response), bytes_in is None.
+        bytes_in = getattr(response.content, 'total_raw_bytes', None)
+        if bytes_in is None:
+            bytes_in = response.content_length
+        response_stats = _DictToObj(
+            url=url,
+            content_encoding=response.headers.get('Content-Encoding'),
+            bytes_in=bytes_in,
+            decoded_size=len(body))
+        self.stats['requests'] += 1
+        if bytes_in is None:
+            self.stats['unknown_bytes_in'] += 1
+        else:
+            self.stats['bytes_in'] += bytes_in
+        self.stats['decoded_size'] += len(body)
+        _LOGGER.debug("Received %s bytes (%s), %d bytes decoded",
+                      bytes_in, response_stats.content_encoding, len(body))
+        return response_stats
 
 class _DictToObj(dict):
     def __getattr__(self, name):
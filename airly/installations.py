@@ -1,4 +1,4 @@
-from airly._private import _EmptyFormat, _DictToObj
+from airly._private import _EmptyFormat, _DictToObj, _load_json
 
 
 class Installation(_DictToObj):
@@ -15,6 +15,17 @@ class Installation(_DictToObj):
         return _DictToObj(self.get('sponsor'))
 
 
+def parse_installation(raw):
+    """Create Installation from response of installations/{id} request"""
+    return Installation(_load_json(raw))
+
+
+def parse_installations(raw):
+    """Create list of Installations from response of installations/nearest
+    request"""
+    return [Installation(x) for x in _load_json(raw)]
+
+
 class _InstallationsLoader:
     def __init__(self, requests_handler):
         self._rh = requests_handler
@@ -26,7 +37,7 @@ class _InstallationsLoader:
     async def load_by_id(self, installation_id):
         data = await self._load(
             self._REQUEST_BY_ID_FORMAT.format(installation_id))
-        return Installation(data)
+        return parse_installation(data)
 
     async def load_nearest(self, latitude, longitude,
                            max_distance_km=None, max_results=None):
@@ -36,7 +47,7 @@ class _InstallationsLoader:
             max_results = _EmptyFormat()
         data = await self._load(self._REQUEST_NEAREST_FORMAT.format(
             latitude, longitude, max_distance_km, max_results))
-        return [Installation(x) for x in data]
+        return parse_installations(data)
 
     def _load(self, request_path):
         return self._rh.get(request_path)
@@ -1,13 +1,45 @@
 import re
+from collections import namedtuple
 from datetime import datetime
 from enum import Enum
 import logging
 from airly import _private
-from airly._private import _EmptyFormat, _DictToObj
+from airly._private import _EmptyFormat, _DictToObj, _load_json
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class Part(Enum):
+    """Parts of measurements response which can be requested to be parsed.
+
+    CURRENT, HISTORY and FORECAST select sections of the response,
+    VALUES, INDEXES and STANDARDS select contents of each measurement.
+    If no section (or no content) is listed, all of them are parsed.
+    Parts may also be given by value, e.g. 'current'.
+    """
+    CURRENT = 'current'
+    HISTORY = 'history'
+    FORECAST = 'forecast'
+    VALUES = 'values'
+    INDEXES = 'indexes'
+    STANDARDS = 'standards'
+
+
+_SECTIONS = frozenset((Part.CURRENT, Part.HISTORY, Part.FORECAST))
+_CONTENTS = frozenset((Part.VALUES, Part.INDEXES, Part.STANDARDS))
+
+
+def _resolve_parts(parts):
+    if parts is None:
+        return frozenset(Part)
+    parts = frozenset(Part(p) for p in parts)
+    if parts.isdisjoint(_SECTIONS):
+        parts |= _SECTIONS
+    if parts.isdisjoint(_CONTENTS):
+        parts |= _CONTENTS
+    return parts
+
+
 class Measurement(_DictToObj):
     """Measurement for specific time period returned from Airly API"""
 
@@ -33,15 +65,21 @@ class Measurement(_DictToObj):
         O3,
     ]
 
-    def _parse_list(self, key):
+    def _parse_list(self, key, skip):
         result = []
+        if key in skip:
+            return result
         list_to_parse = self.get(key)
         if list_to_parse is not None:
             for e in list_to_parse:
                 result.append(_DictToObj(e))
         return result
 
-    def __init__(self, data: dict):
+    def __init__(self, data: dict, skip=frozenset()):
+        """Parse measurement data.
+
+        Keys listed in skip (e.g. 'indexes') are not parsed.
+        """
         super().__init__(data)
 
         # Parse date-times
@@ -50,15 +88,15 @@ class Measurement(_DictToObj):
 
         # Make popular measurements available directly,
         # i.e. instead of x.values['PM1'] make it accessible as x.pm1
-        self.values = {
-            x['name']: x['value'] for x in
-            data['values']} if 'values' in data else {}
+        self.values = {}
+        if 'values' in data and 'values' not in skip:
+            self.values = {x['name']: x['value'] for x in data['values']}
         for t in Measurement.MEASUREMENTS_TYPES:
             self.__setattr__(t.lower(),
                              self.values[t] if t in self.values else None)
 
-        self.indexes = self._parse_list('indexes')
-        self.standards = self._parse_list('standards')
+        self.indexes = self._parse_list('indexes', skip)
+        self.standards = self._parse_list('standards', skip)
 
     @staticmethod
     def _parse_datetime(x):
@@ -75,6 +113,33 @@ class Measurement(_DictToObj):
             return datetime.strptime(x, "%Y-%m-%dT%H:%M:%SZ")
 
 
+Measurements = namedtuple('Measurements', ['current', 'history', 'forecast'])
+
+
+def parse_measurements(raw, parts=None):
+    """Create Measurements tuple from response of any measurements/ request
+
+    Only parts of the response listed in parts (collection of Part) are
+    parsed; skipped sections are left empty.
+    """
+    return _parse_measurements(_load_json(raw), _resolve_parts(parts))
+
+
+def _parse_measurements(data, parts):
+    skip = frozenset(p.value for p in _CONTENTS - parts)
+
+    def parse_section(part):
+        if part not in parts:
+            return []
+        return [Measurement(x, skip) for x in data[part.value]]
+
+    return Measurements(
+        current=Measurement(
+            data['current'] if Part.CURRENT in parts else {}, skip),
+        history=parse_section(Part.HISTORY),
+        forecast=parse_section(Part.FORECAST))
+
+
 class MeasurementsSession:
     """A class for polling for measurements from Airly API."""
 
@@ -83,6 +148,8 @@ class MeasurementsSession:
         NEAREST = 1
         POINT = 2
 
+    Part = Part
+
     _REQUEST_INSTALLATION_FORMAT = \
         "measurements/installation?installationId={:d}"
     _REQUEST_NEAREST_FORMAT = \
@@ -93,8 +160,13 @@ class MeasurementsSession:
                  requests_handler: _private,
                  mode: Mode,
                  **kwargs):
-        """Initialize the connection to specific installation"""
+        """Initialize the connection to specific installation
+
+        Optional parts keyword argument is a collection of Part values
+        which limits what is parsed from responses, see Part.
+        """
         self.requests_handler = requests_handler
+        self.parts = _resolve_parts(kwargs.get('parts'))
         if mode == self.Mode.INSTALLATION:
             self.request_path = self._REQUEST_INSTALLATION_FORMAT.format(
                 kwargs['installation_id'])
@@ -111,10 +183,15 @@ class MeasurementsSession:
         self.current = Measurement({})
         self.history = []
         self.forecast = []
+        self.last_response = None
+
+    def _set_last_response(self, response_stats):
+        self.last_response = response_stats
 
     async def update(self):
         """Get measurements."""
-        data = await self.requests_handler.get(self.request_path)
-        self.current = Measurement(data['current'])
-        self.history = [Measurement(x) for x in data['history']]
-        self.forecast = [Measurement(x) for x in data['forecast']]
+        data = await self.requests_handler.get(
+            self.request_path, on_response=self._set_last_response)
+        measurements = _parse_measurements(data, self.parts)
+        self.current, self.history, self.forecast = measurements
+        return measurements
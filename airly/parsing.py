@@ -0,0 +1,20 @@
+"""
+Building model objects from raw Airly API payloads.
+
+This module does not depend on aiohttp, so it can be used to parse cached
+responses without loading the network layer.
+"""
+from airly.installations import (Installation, parse_installation,
+                                 parse_installations)
+from airly.measurements import (Measurement, Measurements, Part,
+                                parse_measurements)
+
+__all__ = [
+    'Installation',
+    'Measurement',
+    'Measurements',
+    'Part',
+    'parse_installation',
+    'parse_installations',
+    'parse_measurements',
+]
@@ -0,0 +1,176 @@
+"""
+Blocking facade over the asyncio based Airly client.
+
+All requests are executed on a single, long-lived event loop running in
+a background daemon thread, with one pooled aiohttp session per client.
+The facade can be safely shared by many threads at once.
+"""
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+
+from airly import Airly
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _BackgroundLoop:
+    """Event loop running forever in a daemon thread.
+
+    The thread does not survive fork(), so the loop is bound to the process
+    which created it. Forked children start with a new shared loop.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name='airly-event-loop', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coroutine, timeout=None):
+        if self.pid != os.getpid():
+            coroutine.close()
+            raise RuntimeError(
+                "Airly client created before fork cannot be used "
+                "in the child process")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # Do not leave the request running and holding a connection
+            future.cancel()
+            raise
+
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def _get_shared_loop():
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = _BackgroundLoop()
+        return _shared_loop
+
+
+def _reset_shared_loop():
+    # The lock may have been held by another thread at the time of fork
+    global _shared_loop, _shared_loop_lock
+    _shared_loop = None
+    _shared_loop_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_shared_loop)
+
+
+class SyncMeasurementsSession:
+    """Blocking wrapper of MeasurementsSession
+
+    current, history and forecast are replaced one by one on the event loop
+    thread, so while another thread runs update() they may come from
+    different responses. Use the value returned by update() to get
+    consistent measurements.
+    """
+
+    def __init__(self, client, session):
+        self._client = client
+        self._session = session
+
+    @property
+    def current(self):
+        return self._session.current
+
+    @property
+    def history(self):
+        return self._session.history
+
+    @property
+    def forecast(self):
+        return self._session.forecast
+
+    @property
+    def last_response(self):
+        return self._session.last_response
+
+    def update(self):
+        """Get measurements and return them as Measurements tuple."""
+        return self._client._run(self._session.update())
+
+
+class AirlySync:
+    """Blocking counterpart of the Airly class.
+
+    Connections are kept alive in a pool shared by all calling threads,
+    so only the first request to the API pays for connection setup.
+    Call close() (or use the object as a context manager) when done.
+    """
+
+    def __init__(self, api_key, base_url=Airly.AIRLY_API_URL, language=None,
+                 connection_limit=10, timeout=None):
+        self._timeout = timeout
+        self._loop = _get_shared_loop()
+        self._http_session = self._loop.run(
+            self._create_http_session(connection_limit))
+        self._airly = Airly(api_key, self._http_session,
+                            base_url=base_url, language=language)
+
+    @staticmethod
+    async def _create_http_session(connection_limit):
+        import aiohttp
+        connector = aiohttp.TCPConnector(limit=connection_limit)
+        return aiohttp.ClientSession(connector=connector)
+
+    def _run(self, coroutine):
+        return self._loop.run(coroutine, self._timeout)
+
+    def load_installation_by_id(self, installation_id):
+        return self._run(self._airly.load_installation_by_id(installation_id))
+
+    def load_installation_nearest(self, latitude, longitude,
+                                  max_distance_km=None, max_results=None):
+        return self._run(self._airly.load_installation_nearest(
+            latitude, longitude,
+            max_distance_km=max_distance_km, max_results=max_results))
+
+    @property
+    def transfer_stats(self):
+        return self._airly.transfer_stats
+
+    def create_measurements_session_installation(self, installation_id,
+                                                 parts=None):
+        return SyncMeasurementsSession(
+            self, self._airly.create_measurements_session_installation(
+                installation_id, parts=parts))
+
+    def create_measurements_session_nearest(
+            self, latitude, longitude, max_distance_km=None, parts=None):
+        return SyncMeasurementsSession(
+            self, self._airly.create_measurements_session_nearest(
+                latitude, longitude, max_distance_km=max_distance_km,
+                parts=parts))
+
+    def create_measurements_session_point(self, latitude, longitude,
+                                          parts=None):
+        return SyncMeasurementsSession(
+            self, self._airly.create_measurements_session_point(
+                latitude, longitude, parts=parts))
+
+    def close(self):
+        """Close the pooled connections. The event loop keeps running."""
+        if not self._http_session.closed:
+            self._loop.run(self._http_session.close())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,5 +1,15 @@
-from airly._private import _DictToObj
-from unittest import TestCase
+import gzip
+import sys
+from types import SimpleNamespace
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+
+from airly._private import _DictToObj, _RequestsHandler, _accept_encoding
+from utils import run_coroutine_synchronously
+
 
 class _DictToObjTestCase(TestCase):
     def test_init_with_iterable(self):
@@ -16,3 +26,141 @@ class _DictToObjTestCase(TestCase):
         self.assertEqual('value1', sut.key1)
         self.assertEqual(2, sut['key2'])
         self.assertEqual(2, sut.key2)
+
+
+class _FakeResponse:
+    status = 200
+    headers = {'Content-Encoding': 'gzip'}
+    content = None
+    content_length = 12
+
+    def __init__(self, body):
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return self._body
+
+
+class _FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.headers = None
+
+    def get(self, url, headers):
+        self.headers = headers
+        return _FakeResponse(self.body)
+
+
+class _RequestsHandlerTestCase(TestCase):
+    def setUp(self):
+        self.session = _FakeSession(b'{"id": 204, "name": "abc"}')
+        self.sut = _RequestsHandler('key', self.session, 'https://x/')
+
+    def test_accepts_gzip(self):
+        run_coroutine_synchronously(self.sut.get('installations/204'))
+
+        self.assertIn('gzip', self.session.headers['Accept-Encoding'])
+
+    def test_get_accounts_bytes(self):
+        responses = []
+        result = run_coroutine_synchronously(
+            self.sut.get('installations/204', responses.append))
+        run_coroutine_synchronously(self.sut.get('installations/204'))
+
+        self.assertEqual({'id': 204, 'name': 'abc'}, result)
+        self.assertEqual(1, len(responses))
+        self.assertEqual('https://x/installations/204', responses[0].url)
+        self.assertEqual('gzip', responses[0].content_encoding)
+        self.assertEqual(12, responses[0].bytes_in)
+        self.assertEqual(26, responses[0].decoded_size)
+        self.assertEqual(2, self.sut.stats.requests)
+        self.assertEqual(24, self.sut.stats.bytes_in)
+        self.assertEqual(52, self.sut.stats.decoded_size)
+
+    def test_get_unknown_bytes_in(self):
+        responses = []
+        with patch.object(_FakeResponse, 'content_length', None):
+            run_coroutine_synchronously(
+                self.sut.get('installations/204', responses.append))
+
+        self.assertIsNone(responses[0].bytes_in)
+        self.assertEqual(26, responses[0].decoded_size)
+        self.assertEqual(0, self.sut.stats.bytes_in)
+        self.assertEqual(1, self.sut.stats.unknown_bytes_in)
+
+    @staticmethod
+    def patch_aiohttp_modules(compression_utils, http_parser):
+        # None in sys.modules makes the import fail, as with older aiohttp
+        return patch.dict(sys.modules, {
+            'aiohttp.compression_utils': compression_utils,
+            'aiohttp.http_parser': http_parser,
+        })
+
+    def test_accept_encoding_with_decoders(self):
+        with self.patch_aiohttp_modules(
+                SimpleNamespace(HAS_BROTLI=True, HAS_ZSTD=True), None):
+            self.assertEqual('zstd, br, gzip, deflate', _accept_encoding())
+
+    def test_accept_encoding_without_decoders(self):
+        with self.patch_aiohttp_modules(
+                SimpleNamespace(HAS_BROTLI=False, HAS_ZSTD=False),
+                SimpleNamespace(HAS_BROTLI=True)):
+            self.assertEqual('gzip, deflate', _accept_encoding())
+
+    def test_accept_encoding_brotli_in_http_parser(self):
+        with self.patch_aiohttp_modules(
+                None, SimpleNamespace(HAS_BROTLI=True)):
+            self.assertEqual('br, gzip, deflate', _accept_encoding())
+
+
+class _RequestsHandlerServerTestCase(TestCase):
+    """Runs requests against local HTTP server sending compressed data"""
+
+    BODY = b'[' + b','.join([b'{"id": 204}'] * 1000) + b']'
+
+    @staticmethod
+    async def handler(request):
+        response = web.StreamResponse(headers={
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
+        })
+        await response.prepare(request)
+        await response.write(
+            gzip.compress(_RequestsHandlerServerTestCase.BODY))
+        await response.write_eof()
+        return response
+
+    async def get(self):
+        app = web.Application()
+        app.router.add_get('/installations/nearest', self.handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        url = 'http://127.0.0.1:{}/'.format(runner.addresses[0][1])
+        responses = []
+        try:
+            async with aiohttp.ClientSession() as session:
+                sut = _RequestsHandler('key', session, url)
+                data = await sut.get('installations/nearest',
+                                     responses.append)
+        finally:
+            await runner.cleanup()
+        return data, responses[0]
+
+    @skipUnless(hasattr(aiohttp.StreamReader, 'total_raw_bytes'),
+                'aiohttp does not count raw bytes')
+    def test_get_counts_raw_bytes(self):
+        data, response_stats = run_coroutine_synchronously(self.get())
+
+        self.assertEqual(1000, len(data))
+        self.assertEqual('gzip', response_stats.content_encoding)
+        self.assertEqual(len(self.BODY), response_stats.decoded_size)
+        self.assertEqual(len(gzip.compress(self.BODY)),
+                         response_stats.bytes_in)
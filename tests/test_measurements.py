@@ -139,3 +139,82 @@ class MeasurementsSessionTestCase(AirlyTestCase):
         self.wait_for_update(sut)
         self.assert_rh_called_once_with_url(
             'measurements/point?lat=13.456&lng=12.345')
+
+    def test_update_current_values_only(self):
+        self.set_up_next_response_from_file('measurements_typical')
+        sut = MeasurementsSession(
+            self._rh_mock, MeasurementsSession.Mode.INSTALLATION,
+            installation_id=self.TEST_INSTALLATION_ID,
+            parts={MeasurementsSession.Part.CURRENT,
+                   MeasurementsSession.Part.VALUES})
+
+        self.wait_for_update(sut)
+        cur = sut.current
+
+        self.assertEqual(datetime(2019, 2, 13, hour=21), cur.fromDateTime)
+        self.assertEqual(26.6, cur.pm25)
+        self.assertEqual([], cur.indexes)
+        self.assertEqual([], cur.standards)
+        self.assertEqual([], sut.history)
+        self.assertEqual([], sut.forecast)
+
+    def test_update_contents_only_parses_all_sections(self):
+        self.set_up_next_response_from_file('measurements_typical')
+        sut = MeasurementsSession(
+            self._rh_mock, MeasurementsSession.Mode.INSTALLATION,
+            installation_id=self.TEST_INSTALLATION_ID,
+            parts={MeasurementsSession.Part.INDEXES})
+
+        self.wait_for_update(sut)
+
+        self.assertEqual('CAQI', sut.current.indexes[0].name)
+        self.assertEqual({}, sut.current.values)
+        self.assertEqual(24, len(sut.history))
+        self.assertEqual(24, len(sut.forecast))
+
+    def test_update_parts_given_by_value(self):
+        self.set_up_next_response_from_file('measurements_typical')
+        sut = MeasurementsSession(
+            self._rh_mock, MeasurementsSession.Mode.INSTALLATION,
+            installation_id=self.TEST_INSTALLATION_ID, parts=['current'])
+
+        self.wait_for_update(sut)
+
+        self.assertEqual(26.6, sut.current.pm25)
+        self.assertEqual([], sut.history)
+        self.assertEqual([], sut.forecast)
+
+    def test_unknown_part_raises(self):
+        with self.assertRaises(ValueError):
+            MeasurementsSession(
+                self._rh_mock, MeasurementsSession.Mode.INSTALLATION,
+                installation_id=self.TEST_INSTALLATION_ID, parts=['curent'])
+
+        self.assertEqual(0, self._rh_mock.get.call_count)
+
+    def test_parts_iterator_used_for_every_update(self):
+        sut = MeasurementsSession(
+            self._rh_mock, MeasurementsSession.Mode.INSTALLATION,
+            installation_id=self.TEST_INSTALLATION_ID,
+            parts=(p for p in ['current', 'values']))
+
+        for _ in range(2):
+            self.set_up_next_response_from_file('measurements_typical')
+            self.wait_for_update(sut)
+
+            self.assertEqual(26.6, sut.current.pm25)
+            self.assertEqual([], sut.current.indexes)
+            self.assertEqual([], sut.history)
+
+    def test_update_stores_last_response(self):
+        sut = self.create_default_sut()
+        response_stats = {'bytes_in': 10}
+
+        async def get(request_path, on_response=None):
+            on_response(response_stats)
+            return {'current': {}, 'history': [], 'forecast': []}
+        self._rh_mock.get.side_effect = get
+
+        self.wait_for_update(sut)
+
+        self.assertIs(response_stats, sut.last_response)
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from airly import parse_installation, parse_installations, parse_measurements
+
+
+class ParsingTestCase(TestCase):
+
+    @staticmethod
+    def read_bytes(file_id):
+        return Path("data/{}.json".format(file_id)).read_bytes()
+
+    def test_import_does_not_load_aiohttp(self):
+        code = "import sys, airly; print('aiohttp' in sys.modules)"
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], cwd=str(Path('..').resolve()))
+        self.assertEqual(b'False', output.strip())
+
+    def test_parse_installation_from_bytes(self):
+        result = parse_installation(self.read_bytes('installations_typical'))
+
+        self.assertEqual(204, result.id)
+        self.assertEqual('Kraków', result.address.city)
+
+    def test_parse_installations_from_str(self):
+        raw = self.read_bytes('installations_empty').decode()
+
+        self.assertEqual([], parse_installations(raw))
+
+    def test_parse_measurements_from_dict(self):
+        import json
+        data = json.loads(self.read_bytes('measurements_typical'))
+
+        current, history, forecast = parse_measurements(data)
+
+        self.assertEqual(26.6, current.pm25)
+        self.assertEqual(24, len(history))
+        self.assertEqual(24, len(forecast))
@@ -0,0 +1,173 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from aiohttp import web
+
+from airly.synchronous import AirlySync, _get_shared_loop
+
+
+class AirlySyncTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch('airly._private._RequestsHandler')
+        self._rh_mock = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.sut = AirlySync('key')
+        self.addCleanup(self.sut.close)
+
+    def set_up_responses_from_file(self, file_id):
+        file_name = "data/{}.json".format(file_id)
+        with open(file_name) as file:
+            data = json.load(file)
+
+        async def get(request_path, on_response=None):
+            return data
+        self._rh_mock.get.side_effect = get
+
+    def test_load_installation_by_id(self):
+        self.set_up_responses_from_file('installations_typical')
+
+        result = self.sut.load_installation_by_id(204)
+
+        self.assertEqual(204, result.id)
+        self._rh_mock.get.assert_called_once_with('installations/204')
+
+    def test_measurements_session_update(self):
+        self.set_up_responses_from_file('measurements_typical')
+        session = self.sut.create_measurements_session_installation(7)
+
+        measurements = session.update()
+
+        self.assertEqual(26.6, measurements.current.pm25)
+        self.assertEqual(26.6, session.current.pm25)
+        self.assertEqual(24, len(session.history))
+        self.assertEqual(24, len(session.forecast))
+
+    def test_concurrent_calls_from_many_threads(self):
+        self.set_up_responses_from_file('installations_typical')
+        results = []
+
+        def worker():
+            results.append(self.sut.load_installation_by_id(204).id)
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual([204] * 8, results)
+
+    def test_timeout_cancels_request(self):
+        cancelled = threading.Event()
+
+        async def get(request_path, on_response=None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        self._rh_mock.get.side_effect = get
+        self.sut._timeout = 0.05
+
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            self.sut.load_installation_by_id(204)
+
+        self.assertTrue(cancelled.wait(5))
+
+    @skipUnless(hasattr(os, 'fork'), 'requires fork()')
+    def test_usable_in_forked_child(self):
+        # Fork in a separate process, not in the test runner which already
+        # has the background loop thread running
+        output = subprocess.check_output(
+            [sys.executable, '-c', _FORK_SCRIPT],
+            cwd=str(Path('..').resolve()), timeout=30)
+
+        self.assertEqual(b'204 RuntimeError', output.strip())
+
+
+_FORK_SCRIPT = """
+import os
+from unittest.mock import patch
+
+from airly.synchronous import AirlySync
+
+
+async def get(request_path, on_response=None):
+    return {'id': 204}
+
+with patch('airly._private._RequestsHandler') as rh_mock:
+    rh_mock.return_value.get.side_effect = get
+    parent_sut = AirlySync('key')
+    parent_sut.load_installation_by_id(204)
+    pid = os.fork()
+    if pid == 0:
+        with AirlySync('key') as child_sut:
+            result = [str(child_sut.load_installation_by_id(204).id)]
+        try:
+            parent_sut.load_installation_by_id(204)
+        except RuntimeError:
+            result.append('RuntimeError')
+        print(' '.join(result), flush=True)
+        os._exit(0)
+    os.waitpid(pid, 0)
+"""
+
+
+class AirlySyncServerTestCase(TestCase):
+    """Runs requests against local HTTP server, without mocking"""
+
+    def setUp(self):
+        with open("data/installations_typical.json", 'rb') as file:
+            self.body = file.read()
+        self.peers = []
+        self._loop = _get_shared_loop()
+        self._runner, port = self._loop.run(self._start_server())
+        self.addCleanup(self._loop.run, self._runner.cleanup())
+        self.sut = AirlySync('key', 'http://127.0.0.1:{}/'.format(port),
+                             connection_limit=2)
+        self.addCleanup(self.sut.close)
+
+    async def _start_server(self):
+        async def handler(request):
+            self.peers.append(request.transport.get_extra_info('peername'))
+            return web.Response(body=self.body,
+                                content_type='application/json')
+        app = web.Application()
+        app.router.add_get('/installations/{id}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        return runner, runner.addresses[0][1]
+
+    def test_connection_reused_by_many_threads(self):
+        results = []
+
+        def worker():
+            results.append(self.sut.load_installation_by_id(204).id)
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual([204] * 8, results)
+        self.assertEqual(8, len(self.peers))
+        # All concurrent requests were served by the pool of 2 connections
+        self.assertLessEqual(len(set(self.peers)), 2)
+
+    def test_close_closes_session(self):
+        self.sut.load_installation_by_id(204)
+
+        self.sut.close()
+
+        with self.assertRaises(RuntimeError):
+            self.sut.load_installation_by_id(204)